@@ -7,19 +7,74 @@ import os
 import sys
 import time
 import json
+import atexit
+import functools
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
-import requests
+import httpx
+import orjson
 from dotenv import load_dotenv
-from steel import Steel
+from steel import DefaultHttpxClient, Steel
 
 load_dotenv(override=True)
 
 STEEL_API_KEY = os.getenv("STEEL_API_KEY") or "your-steel-api-key-here"
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY") or "your-openai-api-key-here"
+OPENAI_ORG = os.getenv("OPENAI_ORG")
 TASK = os.getenv("TASK") or "Go to Steel.dev and find the latest news"
 
+SCREENSHOT_JPEG_QUALITY = 60
+SCREENSHOT_REENCODE_MIN_BYTES = 200_000
+
+KEY_SYNONYMS = {
+    "ENTER": "Enter",
+    "RETURN": "Enter",
+    "ESC": "Escape",
+    "ESCAPE": "Escape",
+    "TAB": "Tab",
+    "BACKSPACE": "Backspace",
+    "BKSP": "Backspace",
+    "DELETE": "Delete",
+    "DEL": "Delete",
+    "SPACE": "Space",
+    "CTRL": "Control",
+    "CONTROL": "Control",
+    "ALT": "Alt",
+    "SHIFT": "Shift",
+    "META": "Meta",
+    "SUPER": "Meta",
+    "CMD": "Meta",
+    "COMMAND": "Meta",
+    "UP": "ArrowUp",
+    "DOWN": "ArrowDown",
+    "LEFT": "ArrowLeft",
+    "RIGHT": "ArrowRight",
+    "ARROWUP": "ArrowUp",
+    "ARROWDOWN": "ArrowDown",
+    "ARROWLEFT": "ArrowLeft",
+    "ARROWRIGHT": "ArrowRight",
+    "HOME": "Home",
+    "END": "End",
+    "PAGEUP": "PageUp",
+    "PAGEDOWN": "PageDown",
+    "INSERT": "Insert",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_key(key: str) -> str:
+    """Map one OpenAI key name to Steel's vocabulary; cached per distinct name."""
+    k = key.strip()
+    upper = k.upper()
+    if upper in KEY_SYNONYMS:
+        return KEY_SYNONYMS[upper]
+    if upper.startswith("F") and upper[1:].isdigit():
+        return "F" + upper[1:]
+    if len(k) == 1 and k.isalpha() and k.isupper():
+        return k.lower()
+    return k
+
 
 def format_today() -> str:
     return datetime.now().strftime("%A, %B %d, %Y")
@@ -53,26 +108,78 @@ BROWSER_SYSTEM_PROMPT = f"""<BROWSER_ENV>
   </TASK_EXECUTION>"""
 
 
-def create_response(**kwargs):
-    url = "https://api.openai.com/v1/responses"
-    headers = {
-        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
-        "Content-Type": "application/json",
-    }
+def screenshot_data_url(png_base64: str) -> str:
+    """Build the image_url for a Steel PNG screenshot, preferring JPEG.
+
+    Photos and gradients shrink several times over as JPEG; flat, text-only
+    frames can come out larger, so the PNG is kept whenever it is smaller.
+    Frames already under SCREENSHOT_REENCODE_MIN_BYTES are sent as-is.
+    """
+    if len(png_base64) * 3 // 4 < SCREENSHOT_REENCODE_MIN_BYTES:
+        return f"data:image/png;base64,{png_base64}"
+
+    from io import BytesIO
+
+    import pybase64
+    from PIL import Image
+
+    png = pybase64.b64decode(png_base64)
+    image = Image.open(BytesIO(png)).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=SCREENSHOT_JPEG_QUALITY, optimize=True)
+    jpeg = buffer.getvalue()
+    if len(jpeg) >= len(png):
+        return f"data:image/png;base64,{png_base64}"
+    return "data:image/jpeg;base64," + pybase64.b64encode_as_string(jpeg)
+
 
-    openai_org = os.getenv("OPENAI_ORG")
-    if openai_org:
-        headers["Openai-Organization"] = openai_org
+OPENAI_RESPONSES_URL = "https://api.openai.com/v1/responses"
+OPENAI_HEADERS = {
+    "Authorization": f"Bearer {OPENAI_API_KEY}",
+    "Content-Type": "application/json",
+}
+if OPENAI_ORG:
+    OPENAI_HEADERS["Openai-Organization"] = OPENAI_ORG
 
-    response = requests.post(url, headers=headers, json=kwargs)
-    if response.status_code != 200:
-        raise RuntimeError(f"OpenAI API Error: {response.status_code} {response.text}")
-    return response.json()
+# One client for the whole run: every turn reuses the same TLS connection
+# to api.openai.com instead of paying a fresh handshake. Reads have no
+# timeout because a reasoning turn can stream nothing for a while.
+OPENAI_CLIENT = httpx.Client(
+    http2=True,
+    headers=OPENAI_HEADERS,
+    timeout=httpx.Timeout(None, connect=30.0),
+)
+atexit.register(OPENAI_CLIENT.close)
+
+
+def create_response(**kwargs):
+    # The body carries a base64 screenshot; orjson serializes it far faster
+    # than the stdlib encoder httpx's json= would use.
+    body = orjson.dumps({**kwargs, "stream": True})
+    with OPENAI_CLIENT.stream("POST", OPENAI_RESPONSES_URL, content=body) as response:
+        if response.status_code != 200:
+            response.read()
+            raise RuntimeError(
+                f"OpenAI API Error: {response.status_code} {response.text}"
+            )
+
+        for line in response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            yield orjson.loads(data)
 
 
 class Agent:
     def __init__(self):
-        self.steel = Steel(steel_api_key=STEEL_API_KEY)
+        # Every action is a Steel API call; HTTP/2 keeps them on one
+        # multiplexed connection for the whole run.
+        self.steel = Steel(
+            steel_api_key=STEEL_API_KEY,
+            http_client=DefaultHttpxClient(http2=True),
+        )
         self.session = None
         self.model = "gpt-5.5"
 
@@ -84,6 +191,8 @@ class Agent:
         self.print_steps = True
         self.auto_acknowledge_safety = True
 
+        self.last_screenshot: Optional[Tuple[str, str]] = None
+
     def center(self) -> Tuple[int, int]:
         return (self.viewport_width // 2, self.viewport_height // 2)
 
@@ -115,48 +224,7 @@ class Agent:
     def normalize_key(self, key: str) -> str:
         if not isinstance(key, str) or not key:
             return key
-        k = key.strip()
-        upper = k.upper()
-        synonyms = {
-            "ENTER": "Enter",
-            "RETURN": "Enter",
-            "ESC": "Escape",
-            "ESCAPE": "Escape",
-            "TAB": "Tab",
-            "BACKSPACE": "Backspace",
-            "BKSP": "Backspace",
-            "DELETE": "Delete",
-            "DEL": "Delete",
-            "SPACE": "Space",
-            "CTRL": "Control",
-            "CONTROL": "Control",
-            "ALT": "Alt",
-            "SHIFT": "Shift",
-            "META": "Meta",
-            "SUPER": "Meta",
-            "CMD": "Meta",
-            "COMMAND": "Meta",
-            "UP": "ArrowUp",
-            "DOWN": "ArrowDown",
-            "LEFT": "ArrowLeft",
-            "RIGHT": "ArrowRight",
-            "ARROWUP": "ArrowUp",
-            "ARROWDOWN": "ArrowDown",
-            "ARROWLEFT": "ArrowLeft",
-            "ARROWRIGHT": "ArrowRight",
-            "HOME": "Home",
-            "END": "End",
-            "PAGEUP": "PageUp",
-            "PAGEDOWN": "PageDown",
-            "INSERT": "Insert",
-        }
-        if upper in synonyms:
-            return synonyms[upper]
-        if upper.startswith("F") and upper[1:].isdigit():
-            return "F" + upper[1:]
-        if len(k) == 1 and k.isalpha() and k.isupper():
-            return k.lower()
-        return k
+        return resolve_key(key)
 
     def normalize_keys(self, keys: List[str]) -> List[str]:
         return [self.normalize_key(k) for k in keys]
@@ -188,6 +256,15 @@ class Agent:
             raise RuntimeError("No screenshot returned from Steel")
         return img
 
+    def screenshot_url(self, screenshot_base64: str) -> str:
+        # Waits and no-op moves often leave the page untouched; reuse the
+        # encoded URL instead of decoding and re-encoding the same frame.
+        if self.last_screenshot and self.last_screenshot[0] == screenshot_base64:
+            return self.last_screenshot[1]
+        image_url = screenshot_data_url(screenshot_base64)
+        self.last_screenshot = (screenshot_base64, image_url)
+        return image_url
+
     def map_button(self, btn: Optional[str]) -> str:
         b = (btn or "left").lower()
         if b in ("left", "right", "middle", "back", "forward"):
@@ -195,8 +272,8 @@ class Agent:
         return "left"
 
     def execute_computer_action(
-        self, action_type: str, action_args: Dict[str, Any]
-    ) -> str:
+        self, action_type: str, action_args: Dict[str, Any], screenshot: bool = True
+    ) -> Optional[str]:
         body: Dict[str, Any]
 
         if action_type == "move":
@@ -204,7 +281,6 @@ class Agent:
             body = {
                 "action": "move_mouse",
                 "coordinates": [coords[0], coords[1]],
-                "screenshot": True,
             }
 
         elif action_type in ("click",):
@@ -215,7 +291,6 @@ class Agent:
                 "action": "click_mouse",
                 "button": button,
                 "coordinates": [coords[0], coords[1]],
-                "screenshot": True,
             }
             if num_clicks > 1:
                 payload["num_clicks"] = num_clicks
@@ -228,7 +303,6 @@ class Agent:
                 "button": "left",
                 "coordinates": [coords[0], coords[1]],
                 "num_clicks": 2,
-                "screenshot": True,
             }
 
         elif action_type == "drag":
@@ -240,7 +314,7 @@ class Agent:
                 cx, cy = self.center()
                 tx, ty = self.to_coords(action_args.get("x"), action_args.get("y"))
                 steel_path = [[cx, cy], [tx, ty]]
-            body = {"action": "drag_mouse", "path": steel_path, "screenshot": True}
+            body = {"action": "drag_mouse", "path": steel_path}
 
         elif action_type == "scroll":
             coords: Optional[Tuple[int, int]] = None
@@ -248,10 +322,7 @@ class Agent:
                 coords = self.to_coords(action_args.get("x"), action_args.get("y"))
             delta_x = int(self.to_number(action_args.get("scroll_x"), 0))
             delta_y = int(self.to_number(action_args.get("scroll_y"), 0))
-            body = {
-                "action": "scroll",
-                "screenshot": True,
-            }
+            body = {"action": "scroll"}
             if coords:
                 body["coordinates"] = [coords[0], coords[1]]
             if delta_x:
@@ -261,30 +332,33 @@ class Agent:
 
         elif action_type == "type":
             text = action_args.get("text") or ""
-            body = {"action": "type_text", "text": text, "screenshot": True}
+            body = {"action": "type_text", "text": text}
 
         elif action_type == "keypress":
             keys = action_args.get("keys")
             keys_list = self.split_keys(keys)
             normalized = self.normalize_keys(keys_list)
-            body = {"action": "press_key", "keys": normalized, "screenshot": True}
+            body = {"action": "press_key", "keys": normalized}
 
         elif action_type == "wait":
             ms = self.to_number(action_args.get("ms"), 1000)
             seconds = max(0.001, ms / 1000.0)
-            body = {"action": "wait", "duration": seconds, "screenshot": True}
+            body = {"action": "wait", "duration": seconds}
 
         elif action_type == "screenshot":
-            return self.take_screenshot()
+            return self.take_screenshot() if screenshot else None
 
         else:
-            return self.take_screenshot()
+            return self.take_screenshot() if screenshot else None
 
+        body["screenshot"] = screenshot
         resp = self.steel.sessions.computer(
             self.session.id, **{k: v for k, v in body.items() if v is not None}
         )
         img = getattr(resp, "base64_image", None)
-        return img if img else self.take_screenshot()
+        if img or not screenshot:
+            return img
+        return self.take_screenshot()
 
     def execute_task(
         self,
@@ -313,14 +387,24 @@ class Agent:
             if previous_response_id:
                 params["previous_response_id"] = previous_response_id
 
-            response = create_response(**params)
-            if "output" not in response:
-                raise RuntimeError("No output from model")
-            previous_response_id = response.get("id")
-
             tool_outputs: List[Dict[str, Any]] = []
 
-            for item in response["output"]:
+            # Items are handled as soon as each one finishes streaming, so the
+            # first computer_call runs while the model may still be generating.
+            for event in create_response(**params):
+                event_type = event.get("type")
+
+                if event_type == "response.created":
+                    previous_response_id = event["response"]["id"]
+                    continue
+
+                if event_type in ("error", "response.failed"):
+                    raise RuntimeError(f"OpenAI API Error: {json.dumps(event)}")
+
+                if event_type != "response.output_item.done":
+                    continue
+
+                item = event["item"]
                 item_type = item.get("type")
 
                 if item_type == "message":
@@ -333,12 +417,14 @@ class Agent:
                     continue
 
                 if item_type == "reasoning":
+                    if not self.print_steps:
+                        continue
                     summary = " ".join(
                         s.get("text", "")
                         for s in (item.get("summary") or [])
                         if s.get("text")
                     )
-                    if self.print_steps and summary:
+                    if summary:
                         print(f"{summary}")
                     continue
 
@@ -359,12 +445,19 @@ class Agent:
                         [item["action"]] if item.get("action") else []
                     )
 
-                    for action in actions:
+                    # Only the last action of a batch needs a screenshot; the
+                    # model never sees the intermediate frames.
+                    screenshot_base64: Optional[str] = None
+                    for index, action in enumerate(actions):
                         action_type = action.get("type")
                         action_args = {k: v for k, v in action.items() if k != "type"}
                         if self.print_steps:
                             print(f"{action_type}({json.dumps(action_args)})")
-                        self.execute_computer_action(action_type, action_args)
+                        screenshot_base64 = self.execute_computer_action(
+                            action_type,
+                            action_args,
+                            screenshot=index == len(actions) - 1,
+                        )
 
                     pending_checks = item.get("pending_safety_checks", []) or []
                     for check in pending_checks:
@@ -377,7 +470,10 @@ class Agent:
                                 f"Safety check failed: {check.get('message')}"
                             )
 
-                    screenshot_base64 = self.take_screenshot()
+                    # Every action already asks Steel for a post-action screenshot,
+                    # so only fall back to a fresh capture when nothing ran.
+                    if not screenshot_base64:
+                        screenshot_base64 = self.take_screenshot()
                     tool_outputs.append(
                         {
                             "type": "computer_call_output",
@@ -385,7 +481,7 @@ class Agent:
                             "acknowledged_safety_checks": pending_checks,
                             "output": {
                                 "type": "computer_screenshot",
-                                "image_url": f"data:image/png;base64,{screenshot_base64}",
+                                "image_url": self.screenshot_url(screenshot_base64),
                             },
                         }
                     )
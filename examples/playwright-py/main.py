@@ -68,27 +68,29 @@ You can view the session live at \033[1;37m{session.session_viewer_url}\033[0m
 
         # Example script - Navigate to Hacker News and extract the top 5 stories
         print("Navigating to Hacker News...")
-        page.goto("https://news.ycombinator.com", wait_until="networkidle")
-
-        # Find all story rows
-        story_rows = page.locator("tr.athing").all()[:5]  # Get first 5 stories
+        # The story table is in the initial HTML, so there is no need to wait
+        # for analytics beacons to go quiet
+        page.goto("https://news.ycombinator.com", wait_until="domcontentloaded")
+
+        # Extract the top 5 stories in a single page.evaluate round trip,
+        # rather than several locator calls per row
+        stories = page.evaluate("""() =>
+            Array.from(document.querySelectorAll("tr.athing")).slice(0, 5).map((row) => {
+                const link = row.querySelector(".titleline > a");
+                const score = row.nextElementSibling?.querySelector(".score");
+                return {
+                    title: link.textContent,
+                    link: link.getAttribute("href"),
+                    points: score ? score.textContent.split(" ")[0] : "0",
+                };
+            })
+        """)
 
-        # Extract the top 5 stories using Playwright's locators
         print("\nTop 5 Hacker News Stories:")
-        for i, row in enumerate(story_rows, 1):
-            # Get the title and link from the story row
-            title_element = row.locator(".titleline > a")
-            title = title_element.text_content()
-            link = title_element.get_attribute("href")
-            
-            # Get points from the following row
-            points_element = row.locator("xpath=following-sibling::tr[1]").locator(".score")
-            points = points_element.text_content().split()[0] if points_element.count() > 0 else "0"
-
-            # Print the story details
-            print(f"\n{i}. {title}")
-            print(f"   Link: {link}")
-            print(f"   Points: {points}")
+        for i, story in enumerate(stories, 1):
+            print(f"\n{i}. {story['title']}")
+            print(f"   Link: {story['link']}")
+            print(f"   Points: {story['points']}")
 
         # ============================================================
         # End of Automations
@@ -61,13 +61,18 @@ def main():
 You can view the session live at {session.session_viewer_url}
         """)
 
+        # "eager" makes driver.get return at DOMContentLoaded instead of
+        # waiting for every image and script on the page to finish loading
+        options = webdriver.ChromeOptions()
+        options.page_load_strategy = "eager"
+
         # Connect to the session via Selenium's WebDriver using the CustomRemoteConnection class
         driver = webdriver.Remote(
             command_executor=CustomRemoteConnection(
                 remote_server_addr='http://connect.steelbrowser.com/selenium',
                 session_id=session.id
             ),
-            options=webdriver.ChromeOptions()
+            options=options
         )
         print("Connected to browser via Selenium")
 
@@ -84,23 +89,19 @@ You can view the session live at {session.session_viewer_url}
             EC.presence_of_element_located((By.CLASS_NAME, "titleline"))
         )
 
-        # Extract the top 5 stories
-        stories = []
-        story_elements = driver.find_elements(By.CLASS_NAME, "athing")[:5]
-
-        for element in story_elements:
-            title_element = element.find_element(
-                By.CLASS_NAME, "titleline").find_element(By.TAG_NAME, "a")
-            subtext = element.find_element(
-                By.XPATH, "following-sibling::tr[1]")
-            score = subtext.find_element(By.CLASS_NAME, "score") if subtext.find_elements(
-                By.CLASS_NAME, "score") else None
-
-            stories.append({
-                'title': title_element.text,
-                'link': title_element.get_attribute('href'),
-                'points': score.text.split()[0] if score else "0"
-            })
+        # Extract the top 5 stories in one execute_script call; each
+        # find_element would be its own HTTP round-trip to the remote browser
+        stories = driver.execute_script("""
+            return Array.from(document.querySelectorAll("tr.athing")).slice(0, 5).map((row) => {
+                const link = row.querySelector(".titleline > a");
+                const score = row.nextElementSibling?.querySelector(".score");
+                return {
+                    title: link.innerText,
+                    link: link.href,
+                    points: score ? score.innerText.split(" ")[0] : "0",
+                };
+            });
+        """)
 
         # Print the results
         print("\nTop 5 Hacker News Stories:")